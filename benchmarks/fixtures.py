@@ -0,0 +1,65 @@
+"""
+Synthetic CSV fixtures for the benchmark suite. Each file is generated once per
+row count and reused by later runs; the layouts match what the scripts write.
+"""
+import os
+import csv
+import random
+from datetime import datetime, timedelta
+
+QUOTES_HEADER = ["quote", "author", "era"]
+NETWORK_HEADER = ["Timestamp", "Download Speed (Mbps)", "Upload Speed (Mbps)", "Ping (ms)"]
+SESSION_HEADER = ['user_name', 'session_type', 'start_time', 'end_time', 'duration_minutes']
+
+AUTHORS = ["Aristotle", "Socrates", "Plato", "Seneca", "Confucius", "Laozi", "Kant", "Hume", "Nietzsche", "Camus"]
+ERAS = ["Greek", "Roman", "Eastern", "Medieval", "Renaissance", "Enlightenment", "Modern", "Existentialism"]
+USERS = ["henry", "ada", "grace", "alan"]
+
+def _write(file_path, header, rows):
+    temp_path = file_path + ".tmp"
+    with open(temp_path, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(rows)
+    os.replace(temp_path, file_path)
+
+def _quote_rows(count, rng):
+    for i in range(count):
+        yield [f"Synthetic wisdom number {i} about {rng.choice(['virtue', 'time', 'change', 'knowledge'])}.",
+               rng.choice(AUTHORS), rng.choice(ERAS)]
+
+def _network_rows(count, rng):
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        yield [(start + timedelta(minutes=30 * i)).strftime("%Y-%m-%d %H:%M:%S"),
+               f"{rng.uniform(20, 500):.2f}", f"{rng.uniform(5, 100):.2f}", f"{rng.uniform(5, 80):.2f}"]
+
+def _session_rows(count, rng):
+    # The newest sessions land on today so display_daily_summary has work to do
+    now = datetime.now().replace(microsecond=0)
+    for i in range(count):
+        start = now - timedelta(minutes=30 * (count - i))
+        session_type = 'work' if i % 2 == 0 else 'break'
+        duration = 25 if session_type == 'work' else 5
+        yield [rng.choice(USERS), session_type, start.isoformat(), (start + timedelta(minutes=duration)).isoformat(), duration]
+
+GENERATORS = {
+    "quotes": (QUOTES_HEADER, _quote_rows),
+    "network_log": (NETWORK_HEADER, _network_rows),
+    "session_log": (SESSION_HEADER, _session_rows),
+}
+
+def fixture_path(directory, name, rows):
+    return os.path.join(directory, f"{name}_{rows}.csv")
+
+def ensure_fixture(directory, name, rows, seed=0, regenerate=False):
+    """Return the path of the `name` fixture with `rows` data rows, generating it if needed."""
+    os.makedirs(directory, exist_ok=True)
+    file_path = fixture_path(directory, name, rows)
+    # Session logs are dated relative to today, so yesterday's copy is rebuilt
+    stale = os.path.exists(file_path) and name == "session_log" and \
+        datetime.fromtimestamp(os.path.getmtime(file_path)).date() != datetime.now().date()
+    if regenerate or stale or not os.path.exists(file_path):
+        header, generator = GENERATORS[name]
+        _write(file_path, header, generator(rows, random.Random(seed)))
+    return file_path
@@ -0,0 +1,76 @@
+"""
+Microbenchmark for message rotation: the old list-rebuilding MessageHandler
+against the shuffle bags in utils.message_handler, for lists up to 10^6 messages.
+
+    python benchmarks/message_rotation.py --max-size 1000000
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+from rich.table import Table
+from utils.message_handler import ShuffleBag, WeightedShuffleBag
+
+console = Console()
+
+class LegacyMessageHandler:
+    """The previous implementation, kept here only as a baseline."""
+    def __init__(self, messages):
+        self.messages = messages
+        self.used_messages = []
+
+    def get_random_message(self):
+        if not self.messages or len(self.used_messages) >= len(self.messages):
+            self.used_messages = []
+        available_messages = [m for m in self.messages if m not in self.used_messages]
+        message = random.choice(available_messages)
+        self.used_messages.append(message)
+        return message
+
+def time_draws(draw, count):
+    """Return the mean time per call of `draw` in microseconds."""
+    start = time.perf_counter()
+    for _ in range(count):
+        draw()
+    return (time.perf_counter() - start) / count * 1_000_000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark message rotation strategies.")
+    parser.add_argument("--max-size", type=int, default=1_000_000, help="Largest message list to test (powers of ten up to this).")
+    parser.add_argument("--draws", type=int, default=1000, help="Draws timed per strategy, or a full cycle if larger than the list.")
+    parser.add_argument("--legacy-max", type=int, default=10_000, help="Largest list size to run the quadratic legacy handler on.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the shuffle bags.")
+    args = parser.parse_args()
+
+    table = Table(title="Message rotation (µs per draw)", header_style="bold magenta")
+    table.add_column("Messages", justify="right")
+    table.add_column("Legacy", justify="right")
+    table.add_column("ShuffleBag", justify="right")
+    table.add_column("WeightedShuffleBag", justify="right")
+
+    size = 10
+    while size <= args.max_size:
+        messages = [f"Message {i}" for i in range(size)]
+        weights = [1 + (i % 5) for i in range(size)]
+        # Time two full cycles on small lists so refills are included in the amortized cost
+        draws = max(args.draws, 2 * size) if size <= args.draws else args.draws
+
+        legacy = "skipped"
+        if size <= args.legacy_max:
+            legacy = f"{time_draws(LegacyMessageHandler(messages).get_random_message, min(draws, size)):.2f}"
+        bag = time_draws(ShuffleBag(messages, seed=args.seed).draw, draws)
+        weighted = time_draws(WeightedShuffleBag(messages, weights, seed=args.seed).draw, draws)
+
+        table.add_row(f"{size:,}", legacy, f"{bag:.2f}", f"{weighted:.2f}")
+        size *= 10
+
+    console.print(table)
+    console.print("[dim]Shuffle bags pay for a whole cycle on their first draw, so large lists with few draws overstate the per-draw cost.[/dim]")
+
+if __name__ == "__main__":
+    main()
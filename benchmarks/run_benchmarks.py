@@ -0,0 +1,241 @@
+"""
+End-to-end benchmarks for the CSV helpers, history and summary views and message
+rotation, run against synthetic fixtures. The OpenAI client is replaced with a
+local stub, so no network access or API key is needed.
+
+    python benchmarks/run_benchmarks.py --sizes 1e3 1e4 1e5 --output baseline.json
+    python benchmarks/run_benchmarks.py --sizes 1e3 1e4 1e5 --compare baseline.json
+
+Sizes go up to 10^7 rows; the largest fixtures take a while to generate the first time.
+Peak memory is set by the read_csv cases, which load a whole fixture (about 0.6 GB
+at 10^6 rows), so a 10^7 run needs several GB.
+"""
+import os
+import sys
+import csv
+import json
+import time
+import platform
+import argparse
+import statistics
+import importlib.util
+from types import SimpleNamespace
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from rich.console import Console
+from rich.table import Table
+from rich.markup import escape
+import utils.ai_helper as ai_helper
+import utils.csv_helper as csv_helper
+from utils.ai_helper import get_ai_response
+from utils.csv_helper import read_csv, append_csv
+from utils.message_handler import MessageHandler
+from fixtures import ensure_fixture
+
+console = Console()
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIXTURE_DIR = os.path.join(BENCHMARK_DIR, ".fixtures")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results.json")
+MAX_ROWS = 10_000_000
+
+class StubOpenAIClient:
+    """Answers chat completions locally with a fixed reply."""
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        message = SimpleNamespace(content=" A stubbed reply. ")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+def load_script(file_name, module_name, quiet_console):
+    """Import one of the hyphenated top-level scripts as a module with its output silenced."""
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(BASE_DIR, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.console = quiet_console
+    return module
+
+def measure(func, repeat):
+    """Run func `repeat` times and return timing statistics in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {"min_s": min(timings), "median_s": statistics.median(timings), "runs": repeat}
+
+def size_cases(rows, fixture_dir, scratch_dir, network, pomodoro):
+    """Benchmarks whose cost grows with the number of rows, as (name, callable) pairs."""
+    quotes_file = ensure_fixture(fixture_dir, "quotes", rows)
+    network_log = ensure_fixture(fixture_dir, "network_log", rows)
+    session_log = ensure_fixture(fixture_dir, "session_log", rows)
+
+    scratch_file = os.path.join(scratch_dir, f"append_{rows}.csv")
+
+    # Cases build their inputs when they run instead of holding them between runs,
+    # so memory stays bounded by one case at a time even at 10^7 rows
+    def append_batch():
+        if os.path.exists(scratch_file):
+            os.remove(scratch_file)
+        with open(network_log, mode='r', newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            header = next(reader)
+            append_csv(scratch_file, reader, header=header)
+
+    def rotate_messages():
+        handler = MessageHandler([f"Message {i}" for i in range(rows)], seed=0)
+        for _ in range(rows):
+            handler.get_random_message()
+
+    return [
+        ("read_csv[quotes,dict]", lambda: read_csv(quotes_file, as_dict=True)),
+        ("read_csv[network_log]", lambda: read_csv(network_log)),
+        ("read_csv[session_log,dict]", lambda: read_csv(session_log, as_dict=True)),
+        ("append_csv[batch]", append_batch),
+        ("show_history", lambda: network.show_history(network_log)),
+        ("display_daily_summary", lambda: pomodoro.display_daily_summary("henry", session_log)),
+        ("get_user_session_count", lambda: pomodoro.get_user_session_count("henry", session_log)),
+        ("MessageHandler[full cycle]", rotate_messages),
+    ]
+
+def fixed_cases(scratch_dir, calls=1000):
+    """Benchmarks of per-call overhead that don't depend on fixture size."""
+    scratch_file = os.path.join(scratch_dir, "append_single.csv")
+    row = [[datetime(2024, 1, 1).isoformat(), "100.00", "20.00", "15.00"]]
+
+    def append_single_rows():
+        for _ in range(calls):
+            append_csv(scratch_file, row)
+
+    def stubbed_ai_calls():
+        for _ in range(calls):
+            get_ai_response("You are a benchmark.", "Say something.")
+
+    return [
+        (f"append_csv[1 row x{calls}]", append_single_rows),
+        (f"get_ai_response[stub x{calls}]", stubbed_ai_calls),
+    ]
+
+def run(sizes, repeat, fixture_dir):
+    with open(os.devnull, mode='w', encoding='utf-8') as devnull:
+        return run_cases(sizes, repeat, fixture_dir, Console(file=devnull))
+
+def run_cases(sizes, repeat, fixture_dir, quiet_console):
+    ai_helper.get_openai_client = StubOpenAIClient
+    csv_helper.console = quiet_console
+    ai_helper.console = quiet_console
+    network = load_script("network-speed-test.py", "network_speed_test", quiet_console)
+    pomodoro = load_script("pomodoro-timer.py", "pomodoro_timer", quiet_console)
+
+    scratch_dir = os.path.join(fixture_dir, "scratch")
+    os.makedirs(scratch_dir, exist_ok=True)
+
+    results = {}
+    for name, func in fixed_cases(scratch_dir):
+        with console.status(f"[bold cyan]{escape(name)}[/bold cyan]"):
+            results[name] = {"rows": None, **measure(func, repeat)}
+
+    for rows in sizes:
+        with console.status(f"[bold cyan]Preparing fixtures with {rows:,} rows...[/bold cyan]"):
+            cases = size_cases(rows, fixture_dir, scratch_dir, network, pomodoro)
+        for name, func in cases:
+            with console.status(f"[bold cyan]{escape(name)} @ {rows:,} rows[/bold cyan]"):
+                results[f"{name}@{rows}"] = {"rows": rows, **measure(func, repeat)}
+
+    for file_name in os.listdir(scratch_dir):
+        os.remove(os.path.join(scratch_dir, file_name))
+    return results
+
+def print_results(results):
+    table = Table(title="Benchmark results", header_style="bold magenta")
+    table.add_column("Benchmark", style="cyan", overflow="fold")
+    table.add_column("Median (ms)", justify="right")
+    table.add_column("Min (ms)", justify="right")
+    table.add_column("Rows/s", justify="right")
+    for name, stats in results.items():
+        rate = f"{stats['rows'] / stats['median_s']:,.0f}" if stats["rows"] and stats["median_s"] else "-"
+        table.add_row(escape(name), f"{stats['median_s'] * 1000:.2f}", f"{stats['min_s'] * 1000:.2f}", rate)
+    console.print(table)
+
+def load_baseline(baseline_file):
+    with open(baseline_file, mode='r', encoding='utf-8') as file:
+        return json.load(file)["results"]
+
+def compare(results, baseline, baseline_file, threshold):
+    """Print current medians against a baseline run. Returns the number of regressions."""
+    table = Table(title=f"Compared with {baseline_file} (threshold {threshold:.0%})", header_style="bold magenta")
+    table.add_column("Benchmark", style="cyan", overflow="fold")
+    table.add_column("Baseline (ms)", justify="right")
+    table.add_column("Current (ms)", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Status")
+    regressions = 0
+    for name, stats in results.items():
+        if name not in baseline:
+            table.add_row(escape(name), "-", f"{stats['median_s'] * 1000:.2f}", "-", "[dim]new[/dim]")
+            continue
+        before = baseline[name]["median_s"]
+        change = stats["median_s"] / before - 1 if before else 0.0
+        if change > threshold:
+            status = "[bold red]regressed[/bold red]"
+            regressions += 1
+        elif change < -threshold:
+            status = "[bold green]improved[/bold green]"
+        else:
+            status = "ok"
+        table.add_row(escape(name), f"{before * 1000:.2f}", f"{stats['median_s'] * 1000:.2f}", f"{change:+.1%}", status)
+    console.print(table)
+    return regressions
+
+def parse_size(value):
+    rows = int(float(value))
+    if not 0 < rows <= MAX_ROWS:
+        raise argparse.ArgumentTypeError(f"size must be between 1 and {MAX_ROWS:,} rows")
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CSV I/O, history, summaries and message rotation.")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=[1_000, 10_000, 100_000], help="Fixture row counts, e.g. 1e3 1e5 1e7.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (default: 5).")
+    parser.add_argument("--fixture-dir", default=DEFAULT_FIXTURE_DIR, help="Where generated fixtures are kept between runs.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON file to write the results to.")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against an earlier results file and exit non-zero on regressions.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown counted as a regression (default: 0.2).")
+    args = parser.parse_args()
+
+    if args.repeat <= 0:
+        parser.error("--repeat must be a positive number.")
+
+    # Read the baseline up front so --output may safely overwrite it
+    baseline = load_baseline(args.compare) if args.compare else None
+
+    results = run(sorted(set(args.sizes)), args.repeat, args.fixture_dir)
+    print_results(results)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sorted(set(args.sizes)),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, mode='w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    console.print(f"[bold green]Results written to {args.output}[/bold green]")
+
+    if args.compare:
+        regressions = compare(results, baseline, args.compare, args.threshold)
+        if regressions:
+            console.print(f"[bold red]{regressions} benchmark(s) regressed.[/bold red]")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
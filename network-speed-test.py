@@ -21,10 +21,11 @@ from rich.live import Live
 from rich.table import Table
 from rich.markdown import Markdown
 from rich.prompt import Confirm
-import configparser
 from utils.openai_client import get_openai_client
 from utils.ai_helper import get_ai_response
 from utils.csv_helper import append_csv, read_csv
+from utils.instrumentation import enable_profiling, print_profile, span
+from utils.settings import load_settings, SettingsError
 
 console = Console()
 
@@ -52,7 +53,8 @@ def display_ip_details():
         console.print(Panel(f"An unexpected error occurred: {e}", title="[bold red]Error[/bold red]"), style="red")
 
 def test_internet_speed(filename):
-    display_ip_details()
+    with span("speedtest.ip_details"):
+        display_ip_details()
 
     # Prompt user for AI diagnosis choice
     run_ai = Confirm.ask("Would you like to get an AI diagnosis after the test?", default=True)
@@ -67,25 +69,31 @@ def test_internet_speed(filename):
     )
 
     try:
-        with Live(progress, console=console, screen=False, refresh_per_second=10) as live:
+        # The total covers the measurements only, not the prompt or the AI diagnosis
+        with span("speedtest.total"), Live(progress, console=console, screen=False, refresh_per_second=10) as live:
             task = progress.add_task("Running Tests", total=100)
             
-            st = speedtest.Speedtest()
+            with span("speedtest.init"):
+                st = speedtest.Speedtest()
             progress.update(task, advance=20, description="Finding best server")
-            st.get_best_server()
+            with span("speedtest.get_best_server"):
+                st.get_best_server()
             progress.update(task, advance=30, description="Testing download speed")
-            download_speed = st.download() / 1_000_000
+            with span("speedtest.download"):
+                download_speed = st.download() / 1_000_000
             progress.update(task, advance=25, description="Testing upload speed")
-            upload_speed = st.upload() / 1_000_000
+            with span("speedtest.upload"):
+                upload_speed = st.upload() / 1_000_000
             progress.update(task, advance=20, description="Measuring ping")
             ping = st.results.ping
             progress.update(task, advance=5, description="Done!")
 
-        results_text = Text.from_markup(f"Download: [bold green]{download_speed:.2f} Mbps[/bold green] | "
-                                     f"Upload: [bold blue]{upload_speed:.2f} Mbps[/bold blue] | "
-                                     f"Ping: [bold magenta]{ping:.2f} ms[/bold magenta]", justify="center")
-        
-        console.print(Panel(results_text, title="[bold]Speed Test Results[/bold]"))
+        with span("render.results"):
+            results_text = Text.from_markup(f"Download: [bold green]{download_speed:.2f} Mbps[/bold green] | "
+                                         f"Upload: [bold blue]{upload_speed:.2f} Mbps[/bold blue] | "
+                                         f"Ping: [bold magenta]{ping:.2f} ms[/bold magenta]", justify="center")
+            
+            console.print(Panel(results_text, title="[bold]Speed Test Results[/bold]"))
 
         if run_ai:
             with console.status("[bold cyan]Getting AI optimization suggestions...[/bold cyan]", spinner="dots"):
@@ -138,15 +146,16 @@ def show_history(filename):
         downloads_recent = downloads[-30:]
         uploads_recent = uploads[-30:]
 
-        download_chart = asciichart.plot(downloads_recent, {'height': 10})
-        upload_chart = asciichart.plot(uploads_recent, {'height': 10})
+        with span("render.history"):
+            download_chart = asciichart.plot(downloads_recent, {'height': 10})
+            upload_chart = asciichart.plot(uploads_recent, {'height': 10})
 
-        history_text = Text("\nDownload Speed (Mbps):\n", style="bold green")
-        history_text.append(download_chart)
-        history_text.append("\n\nUpload Speed (Mbps):\n", style="bold blue")
-        history_text.append(upload_chart)
+            history_text = Text("\nDownload Speed (Mbps):\n", style="bold green")
+            history_text.append(download_chart)
+            history_text.append("\n\nUpload Speed (Mbps):\n", style="bold blue")
+            history_text.append(upload_chart)
 
-        console.print(Panel(history_text, title="[bold]Historical Network Speeds (last 30 entries)[/bold]"))
+            console.print(Panel(history_text, title="[bold]Historical Network Speeds (last 30 entries)[/bold]"))
     except FileNotFoundError:
         console.print(Panel("No history log found. Run a speed test first.", title="[bold yellow]Warning[/bold yellow]"))
     except Exception as e:
@@ -154,21 +163,26 @@ def show_history(filename):
 
 if __name__ == "__main__":
     try:
-        
-        config = configparser.ConfigParser()
-        config.read('config.ini')
-        paths = config['Paths']
-        network_log = paths.get('network_log', 'data/network_log.csv')
-
         parser = argparse.ArgumentParser(description="Test internet speed and get AI optimization suggestions.")
         parser.add_argument("--history", action="store_true", help="Show a graph of historical speed data.")
+        parser.add_argument("--profile", action="store_true", help="Print a per-phase latency breakdown when the run ends.")
+        parser.add_argument("--profile-json", metavar="PATH", help="Also append profiling events to PATH as JSON lines (implies --profile).")
         args = parser.parse_args()
 
+        if args.profile or args.profile_json:
+            enable_profiling(args.profile_json)
+
+        network_log = load_settings().network_log
+
         if args.history:
             show_history(network_log)
         else:
             test_internet_speed(network_log)
     except KeyboardInterrupt:
         console.print("\n[bold yellow]Process interrupted by user. Exiting...[/bold yellow]")
+    except SettingsError as e:
+        console.print(f"[bold red]Configuration Error: {e}. Please check your config.ini file.[/bold red]")
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
+    finally:
+        print_profile()
@@ -5,11 +5,13 @@ import time
 from rich.console import Console
 from rich.panel import Panel
 from rich.spinner import Spinner
-import configparser
+import argparse
 from utils.openai_client import get_openai_client
 from utils.message_handler import MessageHandler
 from utils.csv_helper import read_csv
 from utils.ai_helper import get_ai_response
+from utils.instrumentation import enable_profiling, print_profile
+from utils.settings import load_settings, SettingsError
 
 console = Console()
 
@@ -92,11 +94,15 @@ def display_random_quote(quotes, search_message_handler, interpretation_message_
 
 if __name__ == "__main__":
     try:
-        
-        config = configparser.ConfigParser()
-        config.read('config.ini')
-        paths = config['Paths']
-        quotes_file = paths.get('quotes_file', 'data/quotes.csv')
+        parser = argparse.ArgumentParser(description="Show philosophy quotes with AI interpretations.")
+        parser.add_argument("--profile", action="store_true", help="Print a per-phase latency breakdown when the run ends.")
+        parser.add_argument("--profile-json", metavar="PATH", help="Also append profiling events to PATH as JSON lines (implies --profile).")
+        args = parser.parse_args()
+
+        if args.profile or args.profile_json:
+            enable_profiling(args.profile_json)
+
+        quotes_file = load_settings().quotes_file
 
         console.print("[bold cyan]Welcome to the Philosophy Quotes Generator![/bold cyan]")
         
@@ -131,7 +137,9 @@ if __name__ == "__main__":
                     break
     except KeyboardInterrupt:
         console.print("\n[bold yellow]Process interrupted by user. Exiting...[/bold yellow]")
-    except (configparser.NoSectionError, configparser.NoOptionError) as e:
+    except SettingsError as e:
         console.print(f"[bold red]Configuration Error: {e}. Please check your config.ini file.[/bold red]")
     except Exception as e:
-        console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
\ No newline at end of file
+        console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
+    finally:
+        print_profile()
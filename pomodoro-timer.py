@@ -10,8 +10,10 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 from rich.table import Table
-import configparser
+import argparse
 from utils.csv_helper import read_csv, append_csv
+from utils.settings import load_settings, SettingsError
+from utils.instrumentation import enable_profiling, print_profile, is_profiling, span, observe, increment
 try:
     import pygame
 except ImportError:
@@ -131,29 +133,51 @@ def countdown(session_type, duration, current_cycle, total_cycles, audio_setting
     tick_interval = 1.0 / tick_speed
     last_tick_time = 0
 
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeRemainingColumn(),
-        console=console,
-        transient=True
-    ) as progress:
-        task = progress.add_task(title, total=duration)
-        start_time = time.monotonic()
-
-        while not progress.finished:
-            elapsed_time = time.monotonic() - start_time
-            
-            if handle_input() == 'skip':
-                return False
-
-            if ticking_sound and elapsed_time - last_tick_time >= tick_interval:
-                ticking_sound.play()
-                last_tick_time = elapsed_time
+    # Frame timings are only collected when profiling, and are summarised once per
+    # session rather than recorded per 10 ms frame
+    profiling = is_profiling()
+    frame_count = 0
+    frame_total = 0.0
+    frame_max = 0.0
 
-            progress.update(task, completed=elapsed_time)
-            time.sleep(0.01) # Sleep for a short time to prevent high CPU usage
+    try:
+        with span(f"countdown.{session_type}"), Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeRemainingColumn(),
+            console=console,
+            transient=True
+        ) as progress:
+            task = progress.add_task(title, total=duration)
+            start_time = time.monotonic()
+
+            while not progress.finished:
+                elapsed_time = time.monotonic() - start_time
+                
+                if handle_input() == 'skip':
+                    increment("countdown.skipped")
+                    return False
+
+                if ticking_sound and elapsed_time - last_tick_time >= tick_interval:
+                    ticking_sound.play()
+                    last_tick_time = elapsed_time
+
+                if profiling:
+                    frame_start = time.perf_counter()
+                    progress.update(task, completed=elapsed_time)
+                    frame_time = time.perf_counter() - frame_start
+                    frame_count += 1
+                    frame_total += frame_time
+                    frame_max = max(frame_max, frame_time)
+                else:
+                    progress.update(task, completed=elapsed_time)
+                time.sleep(0.01) # Sleep for a short time to prevent high CPU usage
+    finally:
+        if frame_count:
+            increment("countdown.frames", frame_count)
+            observe("countdown.frame_mean_ms", frame_total / frame_count * 1000)
+            observe("countdown.frame_max_ms", frame_max * 1000)
             
     return True
 
@@ -220,56 +244,42 @@ def display_daily_summary(user_name, file_path):
 
 if __name__ == "__main__":
     try:
-        config = configparser.ConfigParser()
-        config.read('config.ini')
-
-        paths = config['Paths']
-        quotes_file = paths.get('quotes_file', 'data/quotes.csv')
-        session_log = paths.get('session_log', 'session_log.csv')
-        achievements_log = paths.get('achievements_log', 'pomodoro_achievements.csv')
-
-        pomodoro_settings = config['Pomodoro']
-        user_name = pomodoro_settings.get('user_name', 'User')
-        work_minutes = pomodoro_settings.getint('work_minutes', 25)
-        break_minutes = pomodoro_settings.getint('break_minutes', 5)
-        long_break_minutes = pomodoro_settings.getint('long_break_minutes', 15)
-        total_cycles = pomodoro_settings.getint('cycles', 4)
-        long_break_interval = pomodoro_settings.getint('long_break_interval', 2)
+        parser = argparse.ArgumentParser(description="Pomodoro timer with session logging and achievements.")
+        parser.add_argument("--profile", action="store_true", help="Print a per-phase latency breakdown when the run ends.")
+        parser.add_argument("--profile-json", metavar="PATH", help="Also append profiling events to PATH as JSON lines (implies --profile).")
+        args = parser.parse_args()
+
+        if args.profile or args.profile_json:
+            enable_profiling(args.profile_json)
+
+        settings = load_settings()
 
         audio_settings = {}
         if pygame:
-            try:
-                audio_config = config['Audio']
-                # Ticking Sound
-                if audio_config.getboolean('enable_ticking_sound', False):
-                    tick_file = audio_config.get('tick_sound_file')
-                    if tick_file:
-                        tick_volume = audio_config.getfloat('tick_volume', 1.0)
-                        ticking_sound = SoundEffect(tick_file, tick_volume)
-                        if not ticking_sound.sound:
-                             console.print(f"[bold yellow]Could not load ticking sound file from '{tick_file}'.[/bold yellow]")
-                        audio_settings['ticking_sound'] = ticking_sound
-                        audio_settings['tick_speed'] = audio_config.getfloat('tick_speed', 1.0)
-
-                # Alarm Sound
-                if audio_config.getboolean('enable_alarm_sound', False):
-                    alarm_file = audio_config.get('alarm_sound_file')
-                    if alarm_file:
-                        alarm_volume = audio_config.getfloat('alarm_volume', 1.0)
-                        alarm_sound = SoundEffect(alarm_file, alarm_volume)
-                        if not alarm_sound.sound:
-                             console.print(f"[bold yellow]Could not load alarm sound file from '{alarm_file}'.[/bold yellow]")
-                        audio_settings['alarm_sound'] = alarm_sound
-
-            except (configparser.NoSectionError, configparser.NoOptionError) as e:
-                pass # Audio section is optional
+            # Ticking Sound
+            if settings.enable_ticking_sound and settings.tick_sound_file:
+                if settings.tick_sound_exists:
+                    audio_settings['ticking_sound'] = SoundEffect(settings.tick_sound_file, settings.tick_volume)
+                    audio_settings['tick_speed'] = settings.tick_speed
+                else:
+                    console.print(f"[bold yellow]Could not load ticking sound file from '{settings.tick_sound_file}'.[/bold yellow]")
+
+            # Alarm Sound
+            if settings.enable_alarm_sound and settings.alarm_sound_file:
+                if settings.alarm_sound_exists:
+                    audio_settings['alarm_sound'] = SoundEffect(settings.alarm_sound_file, settings.alarm_volume)
+                else:
+                    console.print(f"[bold yellow]Could not load alarm sound file from '{settings.alarm_sound_file}'.[/bold yellow]")
         
-        pomodoro_timer(work_minutes, break_minutes, long_break_minutes, total_cycles, long_break_interval, user_name, quotes_file, achievements_log, session_log, audio_settings)
+        pomodoro_timer(settings.work_minutes, settings.break_minutes, settings.long_break_minutes, settings.cycles, settings.long_break_interval,
+                       settings.user_name, settings.quotes_file, settings.achievements_log, settings.session_log, audio_settings)
     except KeyboardInterrupt:
         console.print("\n[bold yellow]Timer cancelled. Goodbye![/bold yellow]")
-    except (configparser.NoSectionError, configparser.NoOptionError) as e:
+    except SettingsError as e:
         console.print(f"[bold red]Configuration Error: {e}. Please check your config.ini file.[/bold red]")
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
         if pygame and 'pygame' in str(e).lower():
             console.print("[bold red]An error occurred with the audio system (pygame). Please ensure your audio drivers are working.[/bold red]")
+    finally:
+        print_profile()
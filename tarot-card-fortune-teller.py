@@ -1,22 +1,23 @@
 import random
 import os
 import time
+import argparse
+from functools import lru_cache
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.status import Status
+from rich.table import Table
 from utils.openai_client import get_openai_client
 from utils.ai_helper import get_ai_response
+from utils.message_handler import MessageHandler
+from utils.tarot_deck import TarotDeck, DECKS, SPREADS, format_card
+from utils.reading_cache import ReadingCache
+from utils.instrumentation import enable_profiling, print_profile
+from utils.settings import load_settings, SettingsError
 
 console = Console()
 
-tarot_cards = [
-    "The Fool", "The Magician", "The High Priestess", "The Empress", "The Emperor",
-    "The Hierophant", "The Lovers", "The Chariot", "Strength", "The Hermit",
-    "Wheel of Fortune", "Justice", "The Hanged Man", "Death", "Temperance",
-    "The Devil", "The Tower", "The Star", "The Moon", "The Sun", "Judgement", "The World"
-]
-
 questions = [
     "What's the general energy around me right now?",
     "What's a good area to focus on for personal growth?",
@@ -42,57 +43,131 @@ ORIGINAL_PROGRESS_PAIRS = [
     ("Sifting through symbolism...", "Hearing whispers from beyond..."),
     ("Distilling cosmic clues...", "Embracing celestial messages...")
 ]
-progress_pairs = ORIGINAL_PROGRESS_PAIRS.copy()
+progress_pair_handler = MessageHandler(ORIGINAL_PROGRESS_PAIRS)
 
 def get_progress_pair():
-    """Return a random progress pair and remove it from the global list."""
-    global progress_pairs
-    if not progress_pairs:
-        progress_pairs = ORIGINAL_PROGRESS_PAIRS.copy()
-    pair = random.choice(progress_pairs)
-    progress_pairs.remove(pair)
-    return pair
-
-def main():
+    """Return a random progress pair that has not been shown in the current cycle."""
+    return progress_pair_handler.get_random_message()
+
+SYSTEM_PROMPT = "You are a tarot card reader that provides supportive, concise, and easy-to-understand readings. Focus specifically on answering the user's question using the symbolism of the drawn cards. Provide interpretations that are both meaningful and practical. In 3 sentences or less."
+USER_PROMPT_TEMPLATE = "I have drawn the following tarot cards: {cards}. The focus question is: '{question}'. Please provide a fun, insightful, and easy-to-understand tarot reading that interprets these cards."
+
+@lru_cache(maxsize=1024)
+def build_user_prompt(cards, question):
+    """Render the reading prompt for a tuple of drawn cards and a question."""
+    return USER_PROMPT_TEMPLATE.format(cards=', '.join(cards), question=question)
+
+def generate_reading(cards, question):
+    """Ask the AI for a reading of the drawn cards. Returns None if the request fails."""
+    return get_ai_response(system_message=SYSTEM_PROMPT, user_prompt=build_user_prompt(tuple(cards), question), raise_errors=True)
+
+def describe_spread(spread):
+    """Turn (position, card, reversed) tuples into the card labels used in prompts and cache keys."""
+    return [f"{position}: {format_card(card, reversed_card)}" for position, card, reversed_card in spread]
+
+def warm_cache(cache, args, count):
+    """Generate readings for the next `count` spreads of this seed against every question."""
+    warm_deck = TarotDeck(DECKS[args.deck], reversal_chance=0.5 if args.reversals else 0.0, seed=args.seed)
+    items = []
+    for _ in range(count):
+        drawn_cards = describe_spread(warm_deck.draw_spread(args.spread))
+        items.extend((drawn_cards, question) for question in questions)
+    with console.status(f"[bold blue]Warming {len(items)} readings...[/bold blue]"):
+        added = cache.warm(items)
+    console.print(f"[bold green]Added {added} readings to the cache ({len(cache.readings)} total).[/bold green]")
+
+def pause(seconds, fast=False):
+    """Sleep for dramatic effect unless --fast was given."""
+    if not fast:
+        time.sleep(seconds)
+
+def show_statistics(deck, spread, readings):
+    """Draw many readings in bulk and show how often each card lands in each position."""
+    positions = SPREADS[spread]
+    with console.status(f"[bold yellow]Drawing {readings:,} readings...[/bold yellow]"):
+        start = time.perf_counter()
+        card_counts, reversed_counts = deck.position_counts(readings, len(positions))
+        elapsed = time.perf_counter() - start
+
+    expected = 1 / len(deck.cards)
+    for position, counts, flipped in zip(positions, card_counts, reversed_counts):
+        table = Table(title=f"{position} ({readings:,} readings)", header_style="bold magenta")
+        table.add_column("Card")
+        table.add_column("Frequency", justify="right")
+        table.add_column("Deviation", justify="right")
+        table.add_column("Reversed", justify="right")
+        ranked = sorted(range(len(deck.cards)), key=lambda i: counts[i], reverse=True)
+        for i in ranked[:5] + ranked[-5:]:
+            share = counts[i] / readings
+            reversed_share = flipped[i] / counts[i] if counts[i] else 0.0
+            table.add_row(deck.cards[i], f"{share:.4%}", f"{share - expected:+.4%}", f"{reversed_share:.1%}")
+        console.print(table)
+    console.print(f"[bold green]{readings:,} readings in {elapsed:.2f}s ({readings / elapsed:,.0f} readings/s)[/bold green]")
+
+def main(args, reading_cache_file):
+    deck = TarotDeck(DECKS[args.deck], reversal_chance=0.5 if args.reversals else 0.0, seed=args.seed)
+    if args.stats is not None:
+        show_statistics(deck, args.spread, args.stats)
+        return
+
+    cache = ReadingCache(generate_reading, reading_cache_file)
+    if args.warm is not None:
+        warm_cache(cache, args, args.warm)
+        return
+    try:
+        run_readings(deck, cache, args)
+    finally:
+        cache.close()
+
+def run_readings(deck, cache, args):
+    """Interactive loop: pick a question, reveal the spread and show its reading."""
     console.print(Panel(Text("Welcome to the Terminal Tarot Reading App!", justify="center"), title="[bold magenta]Tarot Reader[/bold magenta]"))
+    # Without a client every prefetch would fail, so only the chosen reading is requested
+    prefetch = not args.no_prefetch and get_openai_client() is not None
+    # Questions get their own generator from the same seed, so a seeded run offers the
+    # same menus without shifting the deck's draws away from the spreads --warm cached
+    question_rng = random.Random(None if args.seed is None else f"questions:{args.seed}")
     while True:
-        sample_questions = random.sample(questions, 3)
+        sample_questions = question_rng.sample(questions, 3)
+        # The cards don't depend on the question, so draw them now and fetch
+        # readings for every offered question while the user is still choosing
+        spread = deck.draw_spread(args.spread)
+        drawn_cards = describe_spread(spread)
+        if prefetch:
+            cache.prefetch((drawn_cards, q) for q in sample_questions)
+
         question_text = ""
         for idx, q in enumerate(sample_questions, start=1):
             question_text += f"{idx}. {q}\n"
         
         console.print(Panel(question_text, title="[bold cyan]Choose a Focus for Your Reading[/bold cyan]"))
         
+        # Re-prompt on a typo instead of redrawing, so a seeded run stays on the same spread
         user_choice = console.input("[bold]Enter the number of your choice (1-3): [/bold]").strip()
-        if user_choice not in ["1", "2", "3"]:
+        while user_choice not in ["1", "2", "3"]:
             console.print("[bold red]Invalid choice. Please select 1, 2, or 3.[/bold red]")
-            continue
+            user_choice = console.input("[bold]Enter the number of your choice (1-3): [/bold]").strip()
         selected_question = sample_questions[int(user_choice)-1]
 
-        drawn_cards = []
         with console.status("[bold yellow]Drawing cards...[/bold yellow]") as status:
-            for i in range(3):
-                time.sleep(1.5)
-                card = random.choice([c for c in tarot_cards if c not in drawn_cards])
-                drawn_cards.append(card)
-                status.update(f"[bold yellow]Drawing cards... ({i+1}/3)[/bold yellow]")
+            for i in range(len(spread)):
+                pause(1.5, args.fast)
+                status.update(f"[bold yellow]Drawing cards... ({i+1}/{len(spread)})[/bold yellow]")
         
-        card_titles = ["1st Card", "2nd Card", "3rd Card"]
-        for i, card in enumerate(drawn_cards):
-            console.print(Panel(Text(f"- {card}", justify="center"), title=f"[bold yellow]{card_titles[i]}[/bold yellow]"))
-            time.sleep(1)
+        for position, card, reversed_card in spread:
+            console.print(Panel(Text(f"- {format_card(card, reversed_card)}", justify="center"), title=f"[bold yellow]{position}[/bold yellow]"))
+            pause(1, args.fast)
 
         interpret_msg, consult_msg = get_progress_pair()
         console.print(f"[bold green]{interpret_msg}[/bold green]")
-        time.sleep(2)
+        pause(2, args.fast)
         console.print(f"[bold green]{consult_msg}[/bold green]")
-        time.sleep(1)
+        pause(1, args.fast)
 
-        with console.status("[bold blue]Consulting the OpenAI spirits...[/bold blue]"):
-            reading = get_ai_response(
-                system_message="You are a tarot card reader that provides supportive, concise, and easy-to-understand readings. Focus specifically on answering the user's question using the symbolism of the drawn cards. Provide interpretations that are both meaningful and practical. In 3 sentences or less.",
-                user_prompt=f"I have drawn the following tarot cards: {', '.join(drawn_cards)}. The focus question is: '{selected_question}'. Please provide a fun, insightful, and easy-to-understand tarot reading that interprets these cards."
-            )
+        reading = cache.get(drawn_cards, selected_question)
+        if reading is None:
+            with console.status("[bold blue]Consulting the OpenAI spirits...[/bold blue]"):
+                reading = cache.get_or_generate(drawn_cards, selected_question)
         
         if reading:
             console.print(Panel(Text(reading, justify="left"), title="[bold green]Your Tarot Reading[/bold green]"))
@@ -104,8 +179,37 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        parser = argparse.ArgumentParser(description="Draw tarot cards and get an AI reading.")
+        parser.add_argument("--fast", action="store_true", help="Skip the dramatic pauses between steps.")
+        parser.add_argument("--seed", type=int, help="Seed the deck for reproducible readings.")
+        parser.add_argument("--deck", choices=DECKS.keys(), default="major", help="Draw from the Major Arcana only or the full 78-card deck.")
+        parser.add_argument("--spread", choices=SPREADS.keys(), default="three-card", help="Layout of the reading.")
+        parser.add_argument("--reversals", action="store_true", help="Allow cards to be drawn reversed.")
+        parser.add_argument("--stats", type=int, metavar="N", help="Draw N readings in bulk and show card frequencies instead of a reading.")
+        parser.add_argument("--warm", type=int, metavar="N", help="Pre-generate readings for the next N spreads of --seed against every question, then exit.")
+        parser.add_argument("--no-prefetch", action="store_true", help="Don't fetch readings in the background while a question is being chosen.")
+        parser.add_argument("--profile", action="store_true", help="Print a per-phase latency breakdown when the run ends.")
+        parser.add_argument("--profile-json", metavar="PATH", help="Also append profiling events to PATH as JSON lines (implies --profile).")
+        args = parser.parse_args()
+
+        if args.stats is not None and args.stats <= 0:
+            parser.error("--stats must be a positive number of readings.")
+        if args.warm is not None and args.warm <= 0:
+            parser.error("--warm must be a positive number of spreads.")
+        # Cached readings are keyed by the exact spread drawn, so only a seeded deck
+        # will ever draw the warmed spreads again
+        if args.warm is not None and args.seed is None:
+            parser.error("--warm requires --seed.")
+
+        if args.profile or args.profile_json:
+            enable_profiling(args.profile_json)
+
+        main(args, load_settings().reading_cache)
     except KeyboardInterrupt:
         console.print("\n[bold yellow]Process interrupted by user. Exiting...[/bold yellow]")
+    except SettingsError as e:
+        console.print(f"[bold red]Configuration Error: {e}. Please check your config.ini file.[/bold red]")
     except Exception as e:
         console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
+    finally:
+        print_profile()
@@ -1,27 +1,35 @@
 from utils.openai_client import get_openai_client
 from rich.console import Console
+from utils.instrumentation import span, increment
 
 console = Console()
 
-def get_ai_response(system_message, user_prompt, max_tokens=150, temperature=0.7):
+def get_ai_response(system_message, user_prompt, max_tokens=150, temperature=0.7, raise_errors=False):
     """
     Generates a response from the OpenAI API based on a system message and user prompt.
-    Returns None if an error occurs.
+    Returns None if an error occurs, or re-raises it when raise_errors is set so callers
+    running in the background can decide when to report it.
     """
     try:
-        client = get_openai_client()
+        with span("openai.client"):
+            client = get_openai_client()
         if not client:
             return None
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=max_tokens,
-            temperature=temperature
-        )
+        with span("openai.chat"):
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": system_message},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+        increment("openai.requests")
         return response.choices[0].message.content.strip()
     except Exception as e:
+        increment("openai.errors")
+        if raise_errors:
+            raise
         console.print(f"[bold red]Error generating AI response: {e}[/bold red]")
         return None
@@ -1,6 +1,7 @@
 import csv
 import os
 from rich.console import Console
+from utils.instrumentation import span, observe
 
 console = Console()
 
@@ -10,12 +11,14 @@ def read_csv(file_path, as_dict=False):
     Handles file not found errors.
     """
     try:
-        with open(file_path, mode='r', encoding='utf-8') as file:
+        with span("csv.read"), open(file_path, mode='r', encoding='utf-8') as file:
             if as_dict:
                 reader = csv.DictReader(file)
             else:
                 reader = csv.reader(file)
-            return list(reader)
+            rows = list(reader)
+        observe("csv.rows_read", len(rows))
+        return rows
     except FileNotFoundError:
         console.print(f"[bold red]Error: The file at {file_path} was not found.[/bold red]")
         return []
@@ -46,7 +49,7 @@ def append_csv(file_path, data, header=None):
     """
     file_exists = os.path.exists(file_path)
     try:
-        with open(file_path, mode='a', newline='', encoding='utf-8') as file:
+        with span("csv.append"), open(file_path, mode='a', newline='', encoding='utf-8') as file:
             writer = csv.writer(file)
             if not file_exists and header:
                 writer.writerow(header)
@@ -0,0 +1,169 @@
+import json
+import time
+import threading
+from functools import wraps
+from collections import defaultdict
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+# Profiling is off unless a script calls enable_profiling(); every entry point
+# checks this flag first so the disabled cost is a global lookup and a branch
+_enabled = False
+_json_file = None
+_started_at = None
+_lock = threading.Lock()
+_spans = defaultdict(list)
+_counters = defaultdict(int)
+_histograms = defaultdict(list)
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        with _lock:
+            _spans[self.name].append(duration)
+            _write_event("span", self.name, duration * 1000, error=exc_type.__name__ if exc_type else None)
+        return False
+
+def _write_event(kind, name, value, **extra):
+    """Append one JSON line to the export file. Caller holds the lock."""
+    if _json_file:
+        event = {"ts": time.time(), "type": kind, "name": name, "value": value}
+        event.update({k: v for k, v in extra.items() if v is not None})
+        _json_file.write(json.dumps(event) + "\n")
+
+def enable_profiling(json_path=None):
+    """Turn instrumentation on, optionally exporting every event as JSON lines to json_path."""
+    global _enabled, _json_file, _started_at
+    if json_path:
+        _json_file = open(json_path, mode='a', encoding='utf-8')
+    _started_at = time.perf_counter()
+    _enabled = True
+
+def is_profiling():
+    return _enabled
+
+def span(name):
+    """Context manager that times a block under `name` when profiling is on."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+def timed(name):
+    """Decorator version of span()."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def increment(name, value=1):
+    """Add to a counter when profiling is on."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] += value
+        _write_event("counter", name, value)
+
+def observe(name, value):
+    """Record a value in a histogram when profiling is on."""
+    if not _enabled:
+        return
+    with _lock:
+        _histograms[name].append(value)
+        _write_event("histogram", name, value)
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def summary():
+    """Return the collected spans, counters and histograms as a plain dict."""
+    with _lock:
+        spans = {}
+        for name, durations in _spans.items():
+            ordered = sorted(durations)
+            spans[name] = {
+                "calls": len(ordered),
+                "total_ms": sum(ordered) * 1000,
+                "mean_ms": sum(ordered) / len(ordered) * 1000,
+                "p50_ms": _percentile(ordered, 0.5) * 1000,
+                "p95_ms": _percentile(ordered, 0.95) * 1000,
+                "max_ms": ordered[-1] * 1000,
+            }
+        histograms = {}
+        for name, values in _histograms.items():
+            ordered = sorted(values)
+            histograms[name] = {
+                "count": len(ordered),
+                "min": ordered[0],
+                "p50": _percentile(ordered, 0.5),
+                "p95": _percentile(ordered, 0.95),
+                "max": ordered[-1],
+            }
+        wall_ms = (time.perf_counter() - _started_at) * 1000 if _started_at is not None else 0.0
+        return {"wall_ms": wall_ms, "spans": spans, "counters": dict(_counters), "histograms": histograms}
+
+def print_profile():
+    """Print the per-phase latency breakdown and close the JSON export. Does nothing when profiling is off."""
+    global _json_file
+    if not _enabled:
+        return
+    data = summary()
+
+    table = Table(title=f"Profile ({data['wall_ms']:.0f} ms wall time)", header_style="bold magenta")
+    table.add_column("Phase", style="cyan", overflow="fold")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Mean (ms)", justify="right")
+    table.add_column("p95 (ms)", justify="right")
+    table.add_column("Max (ms)", justify="right")
+    table.add_column("% of run", justify="right")
+    for name, stats in sorted(data["spans"].items(), key=lambda item: item[1]["total_ms"], reverse=True):
+        share = stats["total_ms"] / data["wall_ms"] if data["wall_ms"] else 0.0
+        table.add_row(name, str(stats["calls"]), f"{stats['total_ms']:.1f}", f"{stats['mean_ms']:.2f}",
+                      f"{stats['p95_ms']:.2f}", f"{stats['max_ms']:.2f}", f"{share:.1%}")
+    console.print(table)
+
+    for name, value in sorted(data["counters"].items()):
+        console.print(f"[bold]{name}[/bold]: {value}")
+    for name, stats in sorted(data["histograms"].items()):
+        console.print(f"[bold]{name}[/bold]: n={stats['count']} min={stats['min']:.3g} "
+                      f"p50={stats['p50']:.3g} p95={stats['p95']:.3g} max={stats['max']:.3g}")
+
+    with _lock:
+        if _json_file:
+            _json_file.write(json.dumps({"ts": time.time(), "type": "summary", **data}) + "\n")
+            _json_file.close()
+            _json_file = None
+
+def reset():
+    """Forget everything recorded so far and restart the wall clock."""
+    global _started_at
+    with _lock:
+        if _started_at is not None:
+            _started_at = time.perf_counter()
+        _spans.clear()
+        _counters.clear()
+        _histograms.clear()
@@ -1,17 +1,71 @@
 import random
 
+class ShuffleBag:
+    """
+    Draws items in random order without repeating any until all have been used.
+    Each cycle is one shuffle of the indices, so a draw is O(1) amortized. The last
+    item of a cycle is never the first item of the next one.
+    """
+    def __init__(self, items, seed=None, rng=None):
+        self.items = list(items)
+        self.rng = rng or random.Random(seed)
+        self._bag = []
+        self._last_index = None
+
+    def _order(self):
+        """Return the indices for a new cycle; the bag is drawn from the end."""
+        order = list(range(len(self.items)))
+        self.rng.shuffle(order)
+        return order
+
+    def _refill(self):
+        self._bag = self._order()
+        if len(self._bag) > 1 and self._bag[-1] == self._last_index:
+            swap = self.rng.randrange(len(self._bag) - 1)
+            self._bag[-1], self._bag[swap] = self._bag[swap], self._bag[-1]
+
+    def draw(self):
+        """Return the next item, starting a new cycle when the current one is used up."""
+        if not self.items:
+            raise IndexError("Cannot draw from an empty list of items.")
+        if not self._bag:
+            self._refill()
+        self._last_index = self._bag.pop()
+        return self.items[self._last_index]
+
+    def __len__(self):
+        """Number of draws left in the current cycle."""
+        return len(self._bag)
+
+class WeightedShuffleBag(ShuffleBag):
+    """
+    Shuffle bag whose cycles are weighted random permutations (Efraimidis-Spirakis):
+    every item still appears once per cycle, but heavier items tend to come up first.
+    Refilling sorts the cycle, so a draw is O(log n) amortized.
+    """
+    def __init__(self, items, weights, seed=None, rng=None):
+        super().__init__(items, seed=seed, rng=rng)
+        self.weights = [float(w) for w in weights]
+        if len(self.weights) != len(self.items):
+            raise ValueError("Expected one weight per item.")
+        if any(w <= 0 for w in self.weights):
+            raise ValueError("Weights must be positive.")
+
+    def _order(self):
+        random_value = self.rng.random
+        keys = [random_value() ** (1.0 / w) for w in self.weights]
+        # Highest key is drawn first, and the bag is popped from the end
+        return sorted(range(len(self.items)), key=keys.__getitem__)
+
 class MessageHandler:
     """Handles lists of messages to avoid repetition."""
-    def __init__(self, messages):
+    def __init__(self, messages, seed=None, weights=None):
         self.messages = messages
-        self.used_messages = []
+        if weights is None:
+            self.bag = ShuffleBag(messages, seed=seed)
+        else:
+            self.bag = WeightedShuffleBag(messages, weights, seed=seed)
 
     def get_random_message(self):
-        """Get a random message and track usage."""
-        if not self.messages or len(self.used_messages) >= len(self.messages):
-            self.used_messages = []
-        
-        available_messages = [m for m in self.messages if m not in self.used_messages]
-        message = random.choice(available_messages)
-        self.used_messages.append(message)
-        return message
+        """Get a random message that has not been used in the current cycle."""
+        return self.bag.draw()
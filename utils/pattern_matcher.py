@@ -0,0 +1,131 @@
+import re
+
+# Marks the end of a pattern in the trie; never clashes with a one-character key
+_END = ""
+
+def _trie_regex(node, normalize_whitespace):
+    """
+    Regex for everything below a trie node. Chains of single children are emitted as
+    one literal, so recursion only happens where patterns branch or end.
+    """
+    branches = []
+    for char in sorted(key for key in node if key != _END):
+        chars = [char]
+        child = node[char]
+        while len(child) == 1 and _END not in child:
+            (char, child), = child.items()
+            chars.append(char)
+        literal = "".join(r"\s+" if normalize_whitespace and c == " " else re.escape(c) for c in chars)
+        branches.append(literal + _trie_regex(child, normalize_whitespace))
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if _END in node else body
+
+class PatternMatcher:
+    """
+    Compiles many literal patterns into a single trie-shaped regular expression, so
+    text is scanned once and a prefix shared by several patterns is only tested once.
+    A pattern that ends where a longer one continues becomes a greedy optional group,
+    which gives leftmost-longest matching: a nested pattern never beats the longer one.
+    With normalize_whitespace, any run of whitespace in a pattern matches any
+    non-empty run of whitespace in the text (leading/trailing whitespace is dropped).
+    """
+    def __init__(self, patterns, normalize_whitespace=False):
+        self.normalize_whitespace = normalize_whitespace
+        if normalize_whitespace:
+            patterns = (" ".join(pattern.split()) for pattern in patterns)
+        self.patterns = [pattern for pattern in dict.fromkeys(patterns) if pattern]
+        if not self.patterns:
+            raise ValueError("At least one non-empty pattern is required.")
+        self.patterns.sort(key=len, reverse=True)
+        # In normalized mode this counts whitespace runs as one character
+        self.max_length = len(self.patterns[0])
+
+        trie = {}
+        for pattern in self.patterns:
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[_END] = True
+        self.regex = re.compile(_trie_regex(trie, normalize_whitespace))
+
+    def hold_start(self, text):
+        """
+        Index from which text must be held back because a match starting there could
+        still need characters that have not arrived yet. Any match starting earlier
+        fits entirely inside `text`.
+        """
+        keep = self.max_length - 1
+        if not self.normalize_whitespace:
+            return max(0, len(text) - keep)
+        index = len(text)
+        while index > 0 and keep > 0:
+            if text[index - 1].isspace():
+                while index > 0 and text[index - 1].isspace():
+                    index -= 1
+            else:
+                index -= 1
+            keep -= 1
+        return index
+
+    def remover(self):
+        """Return a new StreamRemover bound to this matcher."""
+        return StreamRemover(self)
+
+    def remove(self, text):
+        """Remove every pattern occurrence from a complete string."""
+        return self.regex.sub("", text)
+
+class StreamRemover:
+    """
+    Removes pattern matches from text fed in arbitrary chunks, producing the same
+    output as PatternMatcher.remove on the whole input. Only the tail that could
+    still start an unfinished match is held back between chunks.
+    """
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self.buffer = ""
+
+    def feed(self, chunk):
+        """Add a chunk of text and return the part that is safe to output."""
+        text = self.buffer + chunk
+        boundary = self.matcher.hold_start(text)
+        output = []
+        position = 0
+        for match in self.matcher.regex.finditer(text):
+            if match.start() >= boundary:
+                break
+            output.append(text[position:match.start()])
+            position = match.end()
+        safe_end = max(position, boundary)
+        output.append(text[position:safe_end])
+        self.buffer = text[safe_end:]
+        return "".join(output)
+
+    def flush(self):
+        """Return whatever is still held back once the input is exhausted."""
+        remaining = self.matcher.remove(self.buffer)
+        self.buffer = ""
+        return remaining
+
+def load_patterns(file_path):
+    """
+    Reads removal patterns from a text file. Patterns are separated by blank lines,
+    lines starting with '#' are comments, and a multi-line block is one pattern.
+    """
+    patterns = []
+    block = []
+    with open(file_path, mode='r', encoding='utf-8') as file:
+        for line in file:
+            line = line.rstrip("\r\n")
+            if line.startswith("#"):
+                continue
+            if line.strip():
+                block.append(line)
+            elif block:
+                patterns.append("\n".join(block))
+                block = []
+    if block:
+        patterns.append("\n".join(block))
+    return patterns
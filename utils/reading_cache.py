@@ -0,0 +1,110 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from rich.console import Console
+from utils.csv_helper import read_csv, append_csv
+
+console = Console()
+
+class ReadingCache:
+    """
+    Keyed store of generated readings, persisted to a CSV file.
+    `generate(cards, question)` produces a reading (or None/raises on failure); results
+    are cached by the exact cards and question, and can be warmed in bulk or prefetched
+    in background threads so a later lookup is served instantly. Errors raised by
+    `generate` are kept quietly and only reported when that reading is asked for.
+    """
+    HEADER = ["cards", "question", "reading"]
+    CARD_SEPARATOR = " | "
+
+    def __init__(self, generate, file_path=None, max_workers=4):
+        self.generate = generate
+        self.file_path = file_path
+        self.max_workers = max_workers
+        self.readings = {}
+        self.pending = {}
+        self.failures = {}
+        self.lock = threading.Lock()
+        self.executor = None
+        if file_path and os.path.exists(file_path):
+            for row in read_csv(file_path, as_dict=True):
+                key = (tuple(row['cards'].split(self.CARD_SEPARATOR)), row['question'])
+                self.readings[key] = row['reading']
+
+    @staticmethod
+    def make_key(cards, question):
+        return (tuple(cards), question)
+
+    def get(self, cards, question):
+        """Return a cached reading, or None if it has not been generated yet."""
+        return self.readings.get(self.make_key(cards, question))
+
+    def get_or_generate(self, cards, question):
+        """
+        Return a cached reading, waiting on a prefetch in flight or generating it now.
+        A failed prefetch is reported here instead of being retried; returns None on failure.
+        """
+        key = self.make_key(cards, question)
+        with self.lock:
+            if key in self.readings:
+                return self.readings[key]
+            future = self.pending.get(key)
+            failed = key in self.failures
+        if future:
+            reading = future.result()
+        elif failed:
+            reading = None
+        else:
+            reading = self._generate(key)
+        with self.lock:
+            error = self.failures.pop(key, None)
+        if error:
+            console.print(f"[bold red]Error generating AI response: {error}[/bold red]")
+        return reading
+
+    def prefetch(self, items):
+        """Start generating readings for (cards, question) pairs in the background."""
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            for cards, question in items:
+                key = self.make_key(cards, question)
+                if key not in self.readings and key not in self.pending:
+                    self.failures.pop(key, None)
+                    self.pending[key] = self.executor.submit(self._generate, key)
+
+    def warm(self, items):
+        """Generate readings for many (cards, question) pairs and wait for them. Returns the number added."""
+        before = len(self.readings)
+        keys = dict.fromkeys(self.make_key(cards, question) for cards, question in items)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(self._generate, [key for key in keys if key not in self.readings and key not in self.pending]))
+        with self.lock:
+            errors = [self.failures.pop(key) for key in keys if key in self.failures]
+        if errors:
+            console.print(f"[bold red]{len(errors)} readings could not be generated. Last error: {errors[-1]}[/bold red]")
+        return len(self.readings) - before
+
+    def _generate(self, key):
+        cards, question = key
+        reading = None
+        try:
+            reading = self.generate(list(cards), question)
+            return reading
+        except Exception as e:
+            with self.lock:
+                self.failures[key] = e
+            return None
+        finally:
+            with self.lock:
+                self.pending.pop(key, None)
+                if reading and key not in self.readings:
+                    self.readings[key] = reading
+                    if self.file_path:
+                        append_csv(self.file_path, [[self.CARD_SEPARATOR.join(cards), question, reading]], header=self.HEADER)
+
+    def close(self):
+        """Stop background prefetching without waiting for requests in flight."""
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,103 @@
+import os
+import configparser
+from functools import lru_cache
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG_FILE = os.path.join(BASE_DIR, 'config.ini')
+
+# Any option can be overridden with HAQS_<SECTION>_<OPTION>, e.g. HAQS_POMODORO_WORK_MINUTES=50
+ENV_PREFIX = "HAQS_"
+
+# (section, option, default); the default's type decides how the value is parsed
+OPTIONS = [
+    ('Paths', 'quotes_file', 'data/quotes.csv'),
+    ('Paths', 'network_log', 'data/network_log.csv'),
+    ('Paths', 'session_log', 'session_log.csv'),
+    ('Paths', 'achievements_log', 'pomodoro_achievements.csv'),
+    ('Paths', 'reading_cache', 'data/reading_cache.csv'),
+    ('Pomodoro', 'user_name', 'User'),
+    ('Pomodoro', 'work_minutes', 25),
+    ('Pomodoro', 'break_minutes', 5),
+    ('Pomodoro', 'long_break_minutes', 15),
+    ('Pomodoro', 'cycles', 4),
+    ('Pomodoro', 'long_break_interval', 2),
+    ('Audio', 'enable_ticking_sound', False),
+    ('Audio', 'tick_sound_file', ''),
+    ('Audio', 'tick_speed', 1.0),
+    ('Audio', 'tick_volume', 1.0),
+    ('Audio', 'enable_alarm_sound', False),
+    ('Audio', 'alarm_sound_file', ''),
+    ('Audio', 'alarm_volume', 1.0),
+]
+
+PATH_OPTIONS = ['quotes_file', 'network_log', 'session_log', 'achievements_log', 'reading_cache', 'tick_sound_file', 'alarm_sound_file']
+POSITIVE_OPTIONS = ['work_minutes', 'break_minutes', 'long_break_minutes', 'cycles', 'long_break_interval', 'tick_speed']
+VOLUME_OPTIONS = ['tick_volume', 'alarm_volume']
+
+class SettingsError(ValueError):
+    """Raised when config.ini or an environment override holds an invalid value."""
+
+class Settings:
+    """Typed, validated view of config.ini. Paths are absolute, resolved against the config file's directory."""
+    __slots__ = [option for _, option, _ in OPTIONS] + ['config_file', 'tick_sound_exists', 'alarm_sound_exists']
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Settings({fields})"
+
+def _read_option(config, section, option, default):
+    env_name = f"{ENV_PREFIX}{section}_{option}".upper()
+    if env_name in os.environ:
+        if not config.has_section(section):
+            config.add_section(section)
+        config.set(section, option, os.environ[env_name])
+    if not config.has_option(section, option):
+        return default
+
+    try:
+        if isinstance(default, bool):
+            return config.getboolean(section, option)
+        if isinstance(default, int):
+            return config.getint(section, option)
+        if isinstance(default, float):
+            return config.getfloat(section, option)
+    except ValueError as e:
+        raise SettingsError(f"Invalid value for [{section}] {option}: {e}") from e
+    return config.get(section, option)
+
+@lru_cache(maxsize=None)
+def load_settings(config_file=DEFAULT_CONFIG_FILE):
+    """
+    Parses the config file once and returns a cached Settings object.
+    Call load_settings.cache_clear() to pick up changes to the file or environment.
+    """
+    config_file = os.path.abspath(config_file)
+    # No interpolation: a '%' in a path or override is taken literally
+    config = configparser.ConfigParser(interpolation=None)
+    try:
+        config.read(config_file, encoding='utf-8')
+    except configparser.Error as e:
+        raise SettingsError(f"Could not parse {config_file}: {e}") from e
+    base_dir = os.path.dirname(config_file)
+
+    values = {'config_file': config_file}
+    for section, option, default in OPTIONS:
+        values[option] = _read_option(config, section, option, default)
+
+    for option in PATH_OPTIONS:
+        if values[option]:
+            values[option] = os.path.normpath(os.path.join(base_dir, os.path.expanduser(values[option])))
+    for option in POSITIVE_OPTIONS:
+        if values[option] <= 0:
+            raise SettingsError(f"{option} must be greater than zero (got {values[option]}).")
+    for option in VOLUME_OPTIONS:
+        if not 0.0 <= values[option] <= 1.0:
+            raise SettingsError(f"{option} must be between 0 and 1 (got {values[option]}).")
+
+    values['tick_sound_exists'] = bool(values['tick_sound_file']) and os.path.exists(values['tick_sound_file'])
+    values['alarm_sound_exists'] = bool(values['alarm_sound_file']) and os.path.exists(values['alarm_sound_file'])
+    return Settings(**values)
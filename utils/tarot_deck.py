@@ -0,0 +1,116 @@
+import random
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAJOR_ARCANA = [
+    "The Fool", "The Magician", "The High Priestess", "The Empress", "The Emperor",
+    "The Hierophant", "The Lovers", "The Chariot", "Strength", "The Hermit",
+    "Wheel of Fortune", "Justice", "The Hanged Man", "Death", "Temperance",
+    "The Devil", "The Tower", "The Star", "The Moon", "The Sun", "Judgement", "The World"
+]
+
+SUITS = ["Wands", "Cups", "Swords", "Pentacles"]
+RANKS = [
+    "Ace", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine", "Ten",
+    "Page", "Knight", "Queen", "King"
+]
+MINOR_ARCANA = [f"{rank} of {suit}" for suit in SUITS for rank in RANKS]
+FULL_DECK = MAJOR_ARCANA + MINOR_ARCANA
+
+DECKS = {
+    "major": MAJOR_ARCANA,
+    "full": FULL_DECK,
+}
+
+SPREADS = {
+    "three-card": ["1st Card", "2nd Card", "3rd Card"],
+    "single": ["Your Card"],
+    "past-present-future": ["Past", "Present", "Future"],
+    "situation-action-outcome": ["Situation", "Action", "Outcome"],
+    "celtic-cross": [
+        "Present", "Challenge", "Foundation", "Recent Past", "Crown", "Near Future",
+        "Self", "Environment", "Hopes and Fears", "Outcome"
+    ],
+}
+
+def format_card(card, reversed_card=False):
+    """Return a card name, marked when it was drawn reversed."""
+    return f"{card} (Reversed)" if reversed_card else card
+
+class TarotDeck:
+    """
+    Draws cards without replacement from a tarot deck.
+    A seed makes readings reproducible; bulk draws use numpy when it is installed.
+    """
+    def __init__(self, cards=FULL_DECK, reversal_chance=0.0, seed=None):
+        if not 0.0 <= reversal_chance <= 1.0:
+            raise ValueError("reversal_chance must be between 0 and 1.")
+        self.cards = list(cards)
+        self.reversal_chance = reversal_chance
+        self.rng = random.Random(seed)
+
+    def draw(self, count):
+        """Draw `count` distinct cards as (card, reversed) pairs with a single sample call."""
+        if not 0 < count <= len(self.cards):
+            raise ValueError(f"Cannot draw {count} cards from a deck of {len(self.cards)}.")
+        indices = self.rng.sample(range(len(self.cards)), count)
+        return [(self.cards[i], self.rng.random() < self.reversal_chance) for i in indices]
+
+    def draw_spread(self, spread):
+        """Draw one card per position of a named spread as (position, card, reversed) tuples."""
+        if spread not in SPREADS:
+            raise ValueError(f"Unknown spread '{spread}'. Choose from: {', '.join(SPREADS)}.")
+        positions = SPREADS[spread]
+        return [(position, card, reversed_card) for position, (card, reversed_card) in zip(positions, self.draw(len(positions)))]
+
+    def iter_readings(self, readings, count, batch_size=100_000):
+        """
+        Yield (indices, reversed) batches for `readings` readings of `count` cards.
+        With numpy these are (batch, count) arrays; without it, lists of lists.
+        """
+        if not 0 < count <= len(self.cards):
+            raise ValueError(f"Cannot draw {count} cards from a deck of {len(self.cards)}.")
+        deck_size = len(self.cards)
+        if np is not None:
+            generator = np.random.default_rng(self.rng.getrandbits(64))
+            base = np.arange(deck_size, dtype=np.uint8)
+            for start in range(0, readings, batch_size):
+                size = min(batch_size, readings - start)
+                shuffled = generator.permuted(np.broadcast_to(base, (size, deck_size)), axis=1)
+                yield shuffled[:, :count], generator.random((size, count)) < self.reversal_chance
+            return
+
+        sample = self.rng.sample
+        random_value = self.rng.random
+        population = range(deck_size)
+        for start in range(0, readings, batch_size):
+            size = min(batch_size, readings - start)
+            indices = [sample(population, count) for _ in range(size)]
+            reversals = [[random_value() < self.reversal_chance for _ in range(count)] for _ in range(size)]
+            yield indices, reversals
+
+    def position_counts(self, readings, count, batch_size=100_000):
+        """
+        Draw `readings` readings in bulk and count outcomes per position.
+        Returns (card_counts, reversed_counts): one list of per-card counts for each position.
+        """
+        deck_size = len(self.cards)
+        card_counts = [[0] * deck_size for _ in range(count)]
+        reversed_counts = [[0] * deck_size for _ in range(count)]
+        for indices, reversals in self.iter_readings(readings, count, batch_size):
+            if np is not None:
+                for position in range(count):
+                    column = indices[:, position]
+                    drawn = np.bincount(column, minlength=deck_size)
+                    flipped = np.bincount(column[reversals[:, position]], minlength=deck_size)
+                    card_counts[position] = [a + int(b) for a, b in zip(card_counts[position], drawn)]
+                    reversed_counts[position] = [a + int(b) for a, b in zip(reversed_counts[position], flipped)]
+            else:
+                for reading, flips in zip(indices, reversals):
+                    for position, (card_index, flipped) in enumerate(zip(reading, flips)):
+                        card_counts[position][card_index] += 1
+                        if flipped:
+                            reversed_counts[position][card_index] += 1
+        return card_counts, reversed_counts